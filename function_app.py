@@ -1,18 +1,36 @@
 # 필요한 패키지:
-# pip install requests beautifulsoup4 tzdata azure-functions
+# pip install requests aiohttp beautifulsoup4 selectolax orjson brotli tzdata azure-functions
 
+import asyncio
+import hashlib
 import json
+import multiprocessing
+import os
 import re
+import ssl
+import sys
+import tempfile
+import threading
 import time
-from urllib.parse import urljoin, urlparse
-from datetime import datetime, timezone, timedelta
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from urllib.parse import urljoin
+from datetime import date, datetime, timezone, timedelta
 
 # -----------------------------
 # 1) 안전한 임포트(실패해도 앱은 로드)
 # -----------------------------
 REQUESTS_OK = True
+AIOHTTP_OK = True
 BS4_OK = True
+LXML_OK = True
+SELECTOLAX_OK = True
+ORJSON_OK = True
+BROTLI_OK = True
 ZONEINFO_OK = True
+AZURE_OK = True
 IMPORT_ERRORS = {}
 
 try:
@@ -21,12 +39,55 @@ except Exception as e:
     REQUESTS_OK = False
     IMPORT_ERRORS["requests"] = str(e)
 
+# aiohttp 가 없으면 crawl_today 는 스레드 풀 + requests 로 동작
+try:
+    import aiohttp
+except Exception as e:
+    AIOHTTP_OK = False
+    IMPORT_ERRORS["aiohttp"] = str(e)
+
 try:
     from bs4 import BeautifulSoup  # beautifulsoup4
 except Exception as e:
     BS4_OK = False
     IMPORT_ERRORS["beautifulsoup4"] = str(e)
 
+# lxml(C 파서)이 있으면 사용, 없으면 순수 파이썬 html.parser 로 폴백
+try:
+    import lxml  # noqa: F401
+except Exception as e:
+    LXML_OK = False
+    IMPORT_ERRORS["lxml"] = str(e)
+HTML_PARSER = "lxml" if LXML_OK else "html.parser"
+
+# selectolax(lexbor, C 파서)가 있으면 기사 파싱에 사용, 없으면 BeautifulSoup 으로 폴백
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except Exception as e:
+    SELECTOLAX_OK = False
+    IMPORT_ERRORS["selectolax"] = str(e)
+
+# orjson(C 구현)이 있으면 JSON 인코딩/디코딩에 사용, 없으면 표준 json
+try:
+    import orjson
+except Exception as e:
+    ORJSON_OK = False
+    IMPORT_ERRORS["orjson"] = str(e)
+
+# brotli 가 있어야 requests/aiohttp 가 br 응답을 풀 수 있으므로, 있을 때만 br 을 요청
+try:
+    import brotli  # noqa: F401
+except Exception as e:
+    BROTLI_OK = False
+    IMPORT_ERRORS["brotli"] = str(e)
+
+# 로컬에서 azure.functions 미설치 시에도 __main__ 으로 크롤링은 동작하도록 플래그만 남김
+try:
+    import azure.functions as func
+except Exception as e:
+    AZURE_OK = False
+    IMPORT_ERRORS["azure-functions"] = str(e)
+
 # KST 설정 (zoneinfo 실패 환경 대비 폴백)
 try:
     from zoneinfo import ZoneInfo  # Python 3.9+
@@ -47,8 +108,68 @@ HEADERS = {
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
         "AppleWebKit/537.36 (KHTML, like Gecko) "
         "Chrome/120.0.0.0 Safari/537.36"
-    )
+    ),
+    "Accept-Encoding": "gzip, br" if BROTLI_OK else "gzip",
+}
+# 자주 쓰는 정규식은 모듈 로드 시 한 번만 컴파일
+_ARTICLE_URL_RE = re.compile(r"/20\d{2}/\d{2}/")
+# "Month D, YYYY" 모양만 잡고 월 이름은 사전으로 확인(12개 대안 정규식/strptime 대신)
+_HUMAN_DATE_RE = re.compile(r"([A-Z][a-z]+)\s+(\d{1,2}),\s+(\d{4})")
+_MONTHS = {
+    m: i + 1
+    for i, m in enumerate([
+        "January", "February", "March", "April", "May", "June",
+        "July", "August", "September", "October", "November", "December",
+    ])
 }
+_HREF_RE = re.compile(r'href="(https?://(?:www\.)?techcrunch\.com/20\d{2}/\d{2}/[^"#?]+)"')
+_LDJSON_RE = re.compile(
+    r"""<script[^>]+type=["']?application/ld\+json["']?[^>]*>(.*?)</script>""",
+    re.DOTALL | re.IGNORECASE,
+)
+_PUB_META_RE = re.compile(
+    r"""<meta[^>]+property=["']article:published_time["'][^>]+content=["']([^"']+)["']""",
+    re.IGNORECASE,
+)
+# 발행일/본문을 읽어올 LD+JSON 객체 타입
+_LDJSON_ARTICLE_TYPES = {"NewsArticle", "Article", "BlogPosting"}
+# extract_paragraphs 에서 본문으로 치지 않는 영역
+_PARAGRAPH_SKIP_TAGS = frozenset({"aside", "figcaption", "nav", "footer"})
+# 비동기 크롤링 시 동시에 받는 기사 수 상한
+ARTICLE_CONCURRENCY = 8
+# 같은 호스트(techcrunch.com)로 동시에 열어 둘 커넥션 수 상한
+ARTICLE_PER_HOST = 8
+# aiohttp 커넥터의 DNS 캐시 유지 시간(초)
+DNS_CACHE_TTL = 600
+# HTML 파싱(CPU 작업)에 쓸 프로세스 수. 1 이면 프로세스 풀 없이 스레드 executor 사용
+PARSE_WORKERS = os.cpu_count() or 1
+# 응답 본문 최대 크기(넘으면 비정상 페이지로 보고 포기)
+MAX_BODY_BYTES = 2_000_000
+# 날짜 선검사용 <head> 스트리밍 시 최대로 읽을 바이트 수
+HEAD_MAX_BYTES = 256 * 1024
+
+def _build_session():
+    """커넥션 풀/재시도가 설정된 모듈 공용 세션. requests 미설치면 None."""
+    if not REQUESTS_OK:
+        return None
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    session.headers.update(HEADERS)
+    # 모든 요청이 techcrunch.com 한 호스트로 가므로 호스트 풀은 하나, 풀 크기는 넉넉하게
+    adapter = HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=32,
+        pool_block=False,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504]),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+# 호출마다 TCP/TLS 를 새로 맺지 않도록 세션을 재사용
+SESSION = _build_session()
 
 # -----------------------------
 # 2) 크롤링 유틸 (의존성 체크 포함)
@@ -64,111 +185,362 @@ def _require_deps():
         detail = {k: IMPORT_ERRORS.get(k, "missing") for k in missing}
         raise RuntimeError(f"Missing deps: {', '.join(missing)}", detail)
 
-def fetch(url):
+def _json_loads(text):
+    return orjson.loads(text) if ORJSON_OK else json.loads(text)
+
+def _json_dumps(obj, indent=False) -> str:
+    """비ASCII 문자를 이스케이프하지 않는 JSON 문자열(json.dumps(..., ensure_ascii=False) 와 동일)."""
+    if ORJSON_OK:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+    return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None)
+
+def _json_bytes(obj) -> bytes:
+    """HTTP 응답용 UTF-8 JSON 바이트(orjson 은 바로 bytes 를 만들어 인코딩 단계가 없음)."""
+    if ORJSON_OK:
+        return orjson.dumps(obj, default=str)
+    return json.dumps(obj, ensure_ascii=False, default=str).encode("utf-8")
+
+def _response_charset(content_type):
+    """Content-Type 의 charset. 없으면 utf-8(TechCrunch 는 UTF-8) — chardet 류 본문 추정을 건너뜀."""
+    for part in (content_type or "").split(";")[1:]:
+        key, _, value = part.strip().partition("=")
+        if key.lower() == "charset" and value:
+            return value.strip('"\' ')
+    return "utf-8"
+
+def _decode_body(body, charset):
+    try:
+        return body.decode(charset, errors="replace")
+    except LookupError:  # 알 수 없는 charset 이름
+        return body.decode("utf-8", errors="replace")
+
+def _append_capped(buf: bytearray, chunk: bytes, url):
+    buf.extend(chunk)
+    if len(buf) > MAX_BODY_BYTES:
+        raise ValueError(f"response body over {MAX_BODY_BYTES} bytes: {url}")
+
+def fetch(url, headers=None):
+    """
+    (status, headers, text) 반환. 304 응답이면 text 는 None.
+    본문은 MAX_BODY_BYTES 까지만 스트리밍으로 읽고, 넘으면 ValueError.
+    """
+    _require_deps()
+    with SESSION.get(url, headers=headers, timeout=20, stream=True) as r:
+        r.raise_for_status()
+        if r.status_code == 304:
+            return r.status_code, r.headers, None
+        buf = bytearray()
+        for chunk in r.iter_content(65536):
+            _append_capped(buf, chunk, url)
+        return r.status_code, r.headers, _decode_body(buf, _response_charset(r.headers.get("Content-Type")))
+
+def _read_until_head_end(buf: bytearray, chunk: bytes) -> bool:
+    """청크를 버퍼에 붙이고, </head> 를 봤거나 상한에 도달했으면 True."""
+    start = max(0, len(buf) - 7)
+    buf.extend(chunk)
+    return buf.find(b"</head>", start) != -1 or len(buf) >= HEAD_MAX_BYTES
+
+def fetch_head(url):
+    """
+    응답을 스트리밍으로 받다가 </head> 가 보이면 중단하고 그때까지의 HTML 을 반환.
+    발행일만 필요할 때 본문(수백 KB) 다운로드를 생략.
+    """
     _require_deps()
-    r = requests.get(url, headers=HEADERS, timeout=20)
-    r.raise_for_status()
-    return r
+    buf = bytearray()
+    with SESSION.get(url, timeout=20, stream=True) as r:
+        r.raise_for_status()
+        for chunk in r.iter_content(4096):
+            if _read_until_head_end(buf, chunk):
+                break
+    return buf.decode("utf-8", errors="replace")
 
 def get_article_links(category_url=CATEGORY_URL, limit=50):
     """
     카테고리 페이지에서 기사 링크를 최대 limit개까지 수집.
     """
     _require_deps()
-    html = fetch(category_url).text
-    soup = BeautifulSoup(html, "html.parser")
-    links = set()
+    _, _, html = fetch(category_url)
+    return _extract_article_links(html, limit)
+
+def _extract_article_links(html: str, limit=50):
+    # 0) 빠른 경로: DOM 없이 원문에서 절대경로 기사 링크만 정규식으로 수집
+    links = dict.fromkeys(m.group(1) for m in _HREF_RE.finditer(html))  # 삽입 순서를 유지하는 set 대용
+    if len(links) >= limit:
+        return list(links)[:limit]
+
+    # 정규식으로 limit 개를 못 채우면(상대경로/따옴표 형식 차이 등) 찾은 것은 두고 DOM 기반으로 나머지를 채움
+    soup = BeautifulSoup(html, HTML_PARSER)
 
     # 1) h3 내부의 앵커들 우선
     for h3 in soup.find_all("h3"):
         a = h3.find("a", href=True)
         if a and is_article_url(a["href"]):
-            links.add(normalize_link(a["href"]))
-
-    # 2) 보강: 페이지 내 모든 a 중 연-월 패턴 포함 URL
-    if len(links) < limit:
-        for a in soup.find_all("a", href=True):
-            href = a["href"]
-            if is_article_url(href):
-                links.add(normalize_link(href))
+            links[normalize_link(a["href"])] = None
+            if len(links) >= limit:
+                return list(links)
+
+    # 2) 보강: 페이지 내 모든 a 중 연-월 패턴 포함 URL.
+    #    find_all 은 전체 결과 목록을 먼저 만들므로, 트리를 지연 순회하다 limit 도달 시 바로 중단
+    for a in soup.descendants:
+        if getattr(a, "name", None) != "a":
+            continue
+        href = a.get("href")
+        if href and is_article_url(href):
+            links[normalize_link(href)] = None
             if len(links) >= limit:
                 break
 
-    return list(links)[:limit]
+    return list(links)
 
+# 카테고리 페이지의 앵커마다 호출되고 같은 href 가 반복되므로 결과를 캐시
+@lru_cache(maxsize=4096)
 def is_article_url(href: str) -> bool:
     """
     TechCrunch 기사 URL은 일반적으로 /YYYY/MM/ 형태를 가짐.
+    urlparse 없이 문자열 연산으로 호스트만 떼어 확인(상대 경로는 호스트 검사 없이 경로만 봄).
     """
-    try:
-        u = urlparse(href)
-        path = u.path
-        return ("techcrunch.com" in u.netloc or u.netloc == "") and re.search(r"/20\d{2}/\d{2}/", path)
-    except Exception:
-        return False
+    href = href.partition("#")[0].partition("?")[0]  # 쿼리/프래그먼트는 경로가 아님(urlparse 의 path 와 같은 범위만 검사)
+    if href.startswith(("http://", "https://", "//")):
+        netloc, _, path = href.split("//", 1)[1].partition("/")
+        if "techcrunch.com" not in netloc:
+            return False
+        href = "/" + path
+    return _ARTICLE_URL_RE.search(href) is not None
 
+@lru_cache(maxsize=4096)
 def normalize_link(href: str) -> str:
+    # 대부분의 기사 href 는 이미 절대 URL: urljoin(양쪽 전체 파싱)은 상대 경로일 때만
+    if href.startswith(("http://", "https://")):
+        return href
     return urljoin(CATEGORY_URL, href)
 
-def parse_article(url: str):
+# -----------------------------
+# 기사 응답 캐시
+#  - 메모리 LRU + 디스크(/tmp, 워커 단위로 유지) 2단
+#  - CACHE_TTL_SEC 이내 항목은 네트워크 없이 재사용, 지나면 ETag/Last-Modified 조건부 GET
+#  - 디스크는 쓰기 _CACHE_PRUNE_EVERY 번마다 정리: _CACHE_DISK_MAX_AGE 지난 파일 삭제, 남은 게 _CACHE_DISK_MAX 넘으면 오래된 것부터 삭제
+# -----------------------------
+_ARTICLE_CACHE = OrderedDict()  # url -> (etag, last_modified, 파싱 결과 dict, 저장 시각), LRU 순서
+_CACHE_MAX = 512
+_CACHE_LOCK = threading.Lock()  # 스레드 크롤링/동시 인보케이션에서 LRU 갱신·제거가 엇갈리지 않게
+_CACHE_DIR = os.path.join(tempfile.gettempdir(), "crawler3_articles")
+CACHE_TTL_SEC = 3600
+_CACHE_DISK_MAX = 2048
+_CACHE_DISK_MAX_AGE = 24 * 3600  # TTL 이 지나도 조건부 GET 검증값으로 쓰이므로 TTL 보다 길게 보관
+_CACHE_PRUNE_EVERY = 64
+_cache_writes = 0
+
+def _cache_path(url):
+    return os.path.join(_CACHE_DIR, hashlib.sha1(url.encode("utf-8")).hexdigest() + ".json")
+
+def _cache_get(url):
+    """메모리 → 디스크 순으로 캐시 항목 조회. 없으면 None."""
+    entry = _ARTICLE_CACHE.get(url)
+    if entry is not None:
+        return entry
+    try:
+        with open(_cache_path(url), "rb") as f:
+            data = _json_loads(f.read())
+        entry = (data["etag"], data["last_modified"], data["art"], data["stored_at"])
+    except Exception:
+        return None  # 캐시는 최선 노력: 없거나 깨진 파일은 미스로 취급
+    _cache_put(url, entry, persist=False)
+    return entry
+
+def _cache_is_fresh(entry):
+    return time.time() - entry[3] < CACHE_TTL_SEC
+
+def _cache_put(url, entry, persist=True):
+    global _cache_writes
+    with _CACHE_LOCK:
+        _ARTICLE_CACHE[url] = entry
+        _ARTICLE_CACHE.move_to_end(url)
+        while len(_ARTICLE_CACHE) > _CACHE_MAX:
+            _ARTICLE_CACHE.popitem(last=False)
+    if not persist:
+        return
+    etag, last_modified, art, stored_at = entry
+    try:
+        os.makedirs(_CACHE_DIR, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=_CACHE_DIR, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(_json_bytes({"etag": etag, "last_modified": last_modified, "art": art, "stored_at": stored_at}))
+        os.replace(tmp, _cache_path(url))  # 동시 쓰기에도 파일이 반쯤 쓰인 상태로 보이지 않게
+    except Exception:
+        return
+    with _CACHE_LOCK:
+        _cache_writes += 1
+        due = _cache_writes % _CACHE_PRUNE_EVERY == 1  # 첫 쓰기(콜드 스타트 직후)에도 한 번 정리
+    if due:
+        _cache_prune_disk()
+
+def _cache_prune_disk():
+    """디스크 캐시 정리(최선 노력). 오래된 파일과 상한 초과분, 남은 임시 파일을 삭제."""
+    now = time.time()
+    files = []
+    try:
+        with os.scandir(_CACHE_DIR) as it:
+            for e in it:
+                try:
+                    mtime = e.stat().st_mtime
+                    if now - mtime > _CACHE_DISK_MAX_AGE or (e.name.endswith(".tmp") and now - mtime > 60):
+                        os.remove(e.path)
+                    elif e.name.endswith(".json"):
+                        files.append((mtime, e.path))
+                except OSError:
+                    pass  # 다른 워커가 먼저 지웠거나 교체 중
+    except OSError:
+        return
+    if len(files) > _CACHE_DISK_MAX:
+        files.sort()
+        for _, path in files[:len(files) - _CACHE_DISK_MAX]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+def _cache_validators(entry):
+    """캐시 항목으로 조건부 GET 헤더 생성. 항목이 없으면 None."""
+    if not entry:
+        return None
+    etag, last_modified = entry[0], entry[1]
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+    return headers
+
+def _cache_reuse(url, entry, revalidated=False):
+    """
+    캐시된 파싱 결과를 재사용. revalidated=True 는 304 응답(요청 시점에 잡아 둔 항목):
+    저장 시각을 갱신해 TTL 동안 다시 네트워크 없이 쓰도록 함.
+    """
+    if revalidated:
+        entry = entry[:3] + (time.time(),)
+        _cache_put(url, entry)
+    else:
+        with _CACHE_LOCK:
+            if url in _ARTICLE_CACHE:
+                _ARTICLE_CACHE.move_to_end(url)
+    return dict(entry[2])
+
+def _cache_store(url, headers, art):
+    _cache_put(url, (headers.get("ETag", ""), headers.get("Last-Modified", ""), art, time.time()))
+
+def parse_article(url: str, today_date=None, throttle=None):
     """
     기사 페이지에서 제목, 본문, 발행일시(UTC/KST 변환)를 파싱.
+    캐시(TTL 이내)에 있으면 네트워크 없이 반환, 지났으면 조건부 GET 으로 확인해 304 면 파싱을 건너뜀.
+    today_date 를 주면 그 날짜(KST) 기사가 아닐 때 본문 추출 없이 None.
+    처음 보는 기사는 <head> 만 먼저 받아 날짜가 다르면 본문을 받지 않음.
+    throttle(_ThreadThrottle)을 주면 요청(<head>, 본문)마다 그 간격을 지킴.
     """
     _require_deps()
-    res = fetch(url)
-    soup = BeautifulSoup(res.text, "html.parser")
+    entry = _cache_get(url)
+    if entry and _cache_is_fresh(entry):
+        return _cache_reuse(url, entry)
+    if today_date is not None and entry is None:
+        if throttle is not None:
+            throttle.wait()
+        if _is_other_day(parse_article_date_only(url), today_date):
+            return None
+    if throttle is not None:
+        throttle.wait()
+    status, headers, html = fetch(url, headers=_cache_validators(entry))
+    if status == 304 and entry:
+        return _cache_reuse(url, entry, revalidated=True)
+    art = _parse_html_sync(html, url, today_date)
+    if art:
+        _cache_store(url, headers, art)
+    return art
+
+def parse_article_date_only(url: str):
+    """기사 <head> 만 받아 발행일시를 파싱. 찾지 못하면 None(전체 파싱 필요)."""
+    return _head_published_dt(fetch_head(url))
+
+def _head_published_dt(head_html: str):
+    """<head> 조각에서 article:published_time 메타 → LD+JSON 순으로 발행일시 탐색."""
+    m = _PUB_META_RE.search(head_html)
+    if m:
+        try:
+            return _parse_iso(m.group(1))
+        except Exception:
+            pass
+    for obj in iter_ldjson_objects(head_html):
+        dt = _ldjson_published_dt(obj)
+        if dt:
+            return dt
+    return None
+
+def _parse_html_sync(html: str, url: str, today_date=None):
+    """
+    이미 받아온 HTML 을 파싱(네트워크 없음). 동기/비동기 경로가 공유.
+    메타(제목/발행일)를 먼저 구하고, today_date 가 주어졌는데 날짜가 다르면 본문 추출 없이 None.
+    """
+    ld_dt, ld_body = _extract_ldjson_fields(html)
 
-    # 제목
+    if SELECTOLAX_OK:
+        tree = LexborHTMLParser(html)
+        title_text, published_dt = _lx_article_meta(tree, ld_dt)
+    else:
+        # 전체 트리를 만듦: SoupStrainer 로 자르면 <article> 의 조상(aside 등 제외 태그)이 사라지고,
+        # "<article" 문자열만 있고 실제 요소가 없는 페이지에서는 본문 <p> 까지 버려짐
+        soup = BeautifulSoup(html, HTML_PARSER)
+        title_text, published_dt = parse_article_meta(soup, ld_dt)
+    if today_date is not None and not is_today_kst(published_dt, today_date):
+        return None
+
+    return {
+        "url": url,
+        "title": title_text,
+        "published_utc": published_dt.astimezone(timezone.utc).isoformat() if published_dt else None,
+        "published_kst": published_dt.astimezone(KST).isoformat() if published_dt else None,
+        "body": _lx_article_body(tree, ld_body) if SELECTOLAX_OK else parse_article_body(soup, ld_body),
+    }
+
+def parse_article_meta(soup, ld_dt=None):
+    """
+    (제목, 발행일시) 추출. 본문 단락 순회 없이 끝나는 가벼운 단계.
+    ld_dt 는 미리 구한 LD+JSON 발행일시(meta 태그가 없을 때 사용).
+    """
     title = soup.find("h1")
     title_text = title.get_text(strip=True) if title else ""
 
-    # 발행일
     published_dt = (
         get_meta_datetime(soup, "article:published_time")
-        or get_ldjson_datetime(soup)
+        or ld_dt
         or get_time_tag_datetime(soup)
         or get_text_datetime_fallback(soup)
     )
+    return title_text, published_dt
 
-    # 본문
-    body_text = get_ldjson_article_body(soup) or extract_paragraphs(soup)
+def parse_article_body(soup, ld_body=None):
+    """본문: LD+JSON articleBody 가 있으면 그것을, 없으면 <p> 단락을 모아 사용."""
+    return (ld_body or extract_paragraphs(soup) or "").strip()
 
-    return {
-        "url": url,
-        "title": title_text,
-        "published_utc": published_dt.astimezone(timezone.utc).isoformat() if published_dt else None,
-        "published_kst": published_dt.astimezone(KST).isoformat() if published_dt else None,
-        "body": (body_text or "").strip()
-    }
+# 3.11+ 의 fromisoformat 은 "Z" 접미사를 직접 처리
+_ISO_Z_NATIVE = sys.version_info >= (3, 11)
+
+@lru_cache(maxsize=2048)
+def _parse_iso(value: str) -> datetime:
+    """ISO 8601 문자열 파싱(같은 발행시각이 반복되므로 결과를 캐시). 실패 시 ValueError."""
+    return datetime.fromisoformat(value if _ISO_Z_NATIVE else value.replace("Z", "+00:00"))
 
 def get_meta_datetime(soup, prop):
     tag = soup.find("meta", attrs={"property": prop}) or soup.find("meta", attrs={"name": prop})
     if tag and tag.get("content"):
         try:
-            return datetime.fromisoformat(tag["content"].replace("Z", "+00:00"))
+            return _parse_iso(tag["content"])
         except Exception:
             pass
     return None
 
-def get_ldjson_datetime(soup):
-    for s in soup.find_all("script", type="application/ld+json"):
-        try:
-            data = json.loads(s.string or "")
-            candidates = data if isinstance(data, list) else [data]
-            for obj in candidates:
-                if isinstance(obj, dict) and obj.get("@type") in {"NewsArticle", "Article", "BlogPosting"}:
-                    dp = obj.get("datePublished") or obj.get("dateCreated")
-                    if dp:
-                        return datetime.fromisoformat(dp.replace("Z", "+00:00"))
-        except Exception:
-            continue
-    return None
-
 def get_time_tag_datetime(soup):
     t = soup.find("time")
     if t and t.get("datetime"):
         try:
-            return datetime.fromisoformat(t["datetime"].replace("Z", "+00:00"))
+            return _parse_iso(t["datetime"])
         except Exception:
             pass
     if t and t.get_text(strip=True):
@@ -176,83 +548,411 @@ def get_time_tag_datetime(soup):
     return None
 
 def get_text_datetime_fallback(soup):
-    text = soup.get_text(" ", strip=True)
-    return parse_human_datetime(text)
+    """
+    날짜줄이 있을 법한 헤더 영역에서 날짜 모양 텍스트 노드만 골라 검사(전체 페이지 텍스트를 만들지 않음).
+    정규식을 string 필터로 넘겨 노드마다 파이썬 함수를 부르지 않고, 후보는 몇 개까지만 모음.
+    """
+    article = soup.find("article")
+    scope = (article.find("header") if article else None) or soup.find("header") or article or soup
+    for text in scope.find_all(string=_HUMAN_DATE_RE, limit=5):
+        dt = parse_human_datetime(text)
+        if dt:
+            return dt
+    return None
 
 def parse_human_datetime(text: str):
-    m = re.search(r"(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},\s+\d{4}", text)
-    if m:
+    for m in _HUMAN_DATE_RE.finditer(text):
+        month = _MONTHS.get(m.group(1))
+        if month is None:
+            continue  # 월 이름이 아닌 대문자 단어("Series 2, 2024" 등)는 건너뜀
         try:
-            d = datetime.strptime(m.group(0), "%B %d, %Y")
-            return d.replace(tzinfo=timezone.utc)  # 시각 없으면 UTC 자정
-        except Exception:
+            return datetime(int(m.group(3)), month, int(m.group(2)), tzinfo=timezone.utc)  # 시각 없으면 UTC 자정
+        except ValueError:
             return None
     return None
 
-def get_ldjson_article_body(soup):
-    for s in soup.find_all("script", type="application/ld+json"):
+def iter_ldjson_objects(html: str):
+    """
+    원문 HTML 에서 LD+JSON 블록을 정규식으로 찾아(DOM 순회 없음) 기사 타입 객체를 차례로 yield.
+    블록은 소비되는 만큼만 디코딩하므로, 앞쪽에서 원하는 값을 찾으면 나머지는 파싱하지 않음.
+    """
+    for m in _LDJSON_RE.finditer(html):
         try:
-            data = json.loads(s.string or "")
-            candidates = data if isinstance(data, list) else [data]
-            for obj in candidates:
-                if isinstance(obj, dict) and obj.get("@type") in {"NewsArticle", "Article", "BlogPosting"}:
-                    body = obj.get("articleBody")
-                    if body:
-                        return body
+            data = _json_loads(m.group(1))
         except Exception:
             continue
+        for obj in data if isinstance(data, list) else [data]:
+            if isinstance(obj, dict) and _ldjson_is_article(obj.get("@type")):
+                yield obj
+
+def _ldjson_is_article(type_):
+    """@type 이 기사 타입인지. 문자열 또는 문자열 목록(["NewsArticle", ...])을 허용, 그 밖의 값은 False."""
+    if isinstance(type_, str):
+        return type_ in _LDJSON_ARTICLE_TYPES
+    if isinstance(type_, list):
+        return any(isinstance(t, str) and t in _LDJSON_ARTICLE_TYPES for t in type_)
+    return False
+
+def _ldjson_published_dt(obj):
+    dp = obj.get("datePublished") or obj.get("dateCreated")
+    if dp:
+        try:
+            return _parse_iso(dp)
+        except Exception:
+            pass
     return None
 
+def _extract_ldjson_fields(html: str):
+    """
+    LD+JSON 블록을 한 번씩만 디코딩해 (발행일시, articleBody)를 함께 반환.
+    각 값은 처음 발견된 것을 사용하고, 둘 다 찾으면 남은 블록은 디코딩하지 않음.
+    """
+    published_dt = None
+    body = None
+    for obj in iter_ldjson_objects(html):
+        if published_dt is None:
+            published_dt = _ldjson_published_dt(obj)
+        if body is None and isinstance(obj.get("articleBody"), str) and obj["articleBody"]:
+            body = obj["articleBody"]
+        if published_dt is not None and body is not None:
+            break
+    return published_dt, body
+
 def extract_paragraphs(soup):
+    """
+    article 아래 <p> 텍스트를 문서 순서대로 모음. 제외 태그(aside 등)의 서브트리는
+    아예 내려가지 않는 한 번의 순회로 처리(<p> 마다 조상을 다시 훑지 않음).
+    """
     article = soup.find("article") or soup
+    if article.find_parent(_PARAGRAPH_SKIP_TAGS):
+        return ""
+    paragraphs = []
+    stack = [iter(article.children)]
+    while stack:
+        node = next(stack[-1], None)
+        if node is None:
+            stack.pop()
+            continue
+        name = getattr(node, "name", None)
+        if name is None or name in _PARAGRAPH_SKIP_TAGS:
+            continue  # 텍스트 노드 또는 제외 서브트리
+        if name == "p":
+            txt = node.get_text(" ", strip=True)
+            if len(txt) >= 2:
+                paragraphs.append(txt)
+            continue
+        stack.append(iter(node.children))
+    return "\n\n".join(paragraphs)
+
+# selectolax 판 추출 헬퍼: bs4 헬퍼와 같은 우선순위/기준으로 동작
+def _lx_attr_datetime(node, attr):
+    value = node.attributes.get(attr) if node is not None else None
+    if value:
+        try:
+            return _parse_iso(value)
+        except Exception:
+            pass
+    return None
+
+def _lx_article_meta(tree, ld_dt=None):
+    """parse_article_meta 의 selectolax 판. (제목, 발행일시)."""
+    title = tree.css_first("h1")
+    title_text = title.text(strip=True) if title is not None else ""
+
+    meta = (
+        tree.css_first('meta[property="article:published_time"]')
+        or tree.css_first('meta[name="article:published_time"]')
+    )
+    published_dt = (
+        _lx_attr_datetime(meta, "content")
+        or ld_dt
+        or _lx_time_tag_datetime(tree)
+        or _lx_text_datetime_fallback(tree)
+    )
+    return title_text, published_dt
+
+def _lx_time_tag_datetime(tree):
+    t = tree.css_first("time")
+    if t is None:
+        return None
+    dt = _lx_attr_datetime(t, "datetime")
+    if dt:
+        return dt
+    text = t.text(separator=" ", strip=True)
+    return parse_human_datetime(text) if text else None
+
+def _lx_text_datetime_fallback(tree):
+    """get_text_datetime_fallback 의 selectolax 판. 헤더 영역 텍스트 노드 중 날짜 모양 후보 몇 개만 검사."""
+    article = tree.css_first("article")
+    scope = (article.css_first("header") if article is not None else None) or tree.css_first("header") or article or tree.root
+    candidates = 0
+    for node in scope.traverse(include_text=True):
+        if node.tag != "-text":
+            continue
+        text = node.text(deep=False)
+        if not _HUMAN_DATE_RE.search(text):
+            continue
+        dt = parse_human_datetime(text)
+        if dt:
+            return dt
+        candidates += 1
+        if candidates >= 5:
+            break
+    return None
+
+def _lx_article_body(tree, ld_body=None):
+    """parse_article_body 의 selectolax 판."""
+    return (ld_body or _lx_paragraphs(tree) or "").strip()
+
+def _lx_paragraphs(tree):
+    """extract_paragraphs 의 selectolax 판. 제외 태그 서브트리는 내려가지 않음."""
+    article = tree.css_first("article") or tree.root
+    parent = article.parent
+    while parent is not None:
+        if parent.tag in _PARAGRAPH_SKIP_TAGS:
+            return ""
+        parent = parent.parent
     paragraphs = []
-    for p in article.find_all("p"):
-        bad = p.find_parent(["aside", "figcaption", "nav", "footer"])
-        if bad:
+    stack = [article.iter()]
+    while stack:
+        node = next(stack[-1], None)
+        if node is None:
+            stack.pop()
+            continue
+        if node.tag in _PARAGRAPH_SKIP_TAGS:
+            continue
+        if node.tag == "p":
+            txt = node.text(separator=" ", strip=True)
+            if len(txt) >= 2:
+                paragraphs.append(txt)
             continue
-        txt = p.get_text(" ", strip=True)
-        if len(txt) >= 2:
-            paragraphs.append(txt)
+        stack.append(node.iter())
     return "\n\n".join(paragraphs)
 
-def is_today_kst(dt: datetime, today_kst: datetime):
+def is_today_kst(dt: datetime, today_date: date):
+    """dt 의 KST 날짜가 today_date 인지. today_date 는 호출 측에서 한 번만 계산해 넘김."""
     if not dt:
         return False
-    return dt.astimezone(KST).date() == today_kst.date()
+    return dt.astimezone(KST).date() == today_date
+
+def _is_other_day(dt, today_date):
+    """날짜를 확정했고 그게 today_date 가 아니면 True(날짜 미확정이면 False: 전체 파싱으로 판정)."""
+    return dt is not None and not is_today_kst(dt, today_date)
+
+def _is_today_article(art, today_date):
+    """
+    파싱 결과가 today_date 날짜의 기사인지. 동기/비동기 크롤링이 같은 기준으로 거름.
+    published_kst 는 KST 로 바꾼 isoformat 이라 앞 10자가 곧 KST 날짜: 다시 datetime 으로 파싱하지 않음.
+    """
+    return bool(art and art["published_kst"]) and art["published_kst"][:10] == today_date.isoformat()
 
 def crawl_today(category_url=CATEGORY_URL, today_kst=None, limit=40, sleep_sec=1.0):
     _require_deps()
+    if not AIOHTTP_OK:
+        return _crawl_today_threaded(category_url, today_kst, limit, sleep_sec)
+    return asyncio.run(crawl_today_async(category_url, today_kst, limit, sleep_sec))
+
+class _ThreadThrottle:
+    """_RequestThrottle 의 스레드 버전: 여러 워커 스레드의 요청 시작 간격을 min_interval 초 이상으로 유지."""
+
+    def __init__(self, min_interval: float):
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._last = 0.0
+
+    def wait(self):
+        if self.min_interval <= 0:
+            return
+        with self._lock:
+            delay = self._last + self.min_interval - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            self._last = time.monotonic()
+
+def _crawl_today_threaded(category_url=CATEGORY_URL, today_kst=None, limit=40, sleep_sec=1.0):
+    """
+    aiohttp 미설치 환경용: requests 세션을 공유하는 스레드 풀로 기사를 병렬 수집.
+    requests 는 소켓 I/O 중 GIL 을 놓으므로 워커 수만큼 대기 시간이 겹침.
+    sleep_sec 의 의미는 비동기 버전과 동일(전체 시작 간격 sleep_sec / ARTICLE_PER_HOST).
+    """
     if today_kst is None:
         today_kst = datetime.now(KST)
+    today_date = today_kst.astimezone(KST).date()  # 기사마다 다시 계산하지 않도록 한 번만
     links = get_article_links(category_url, limit=limit)
-    results = []
-    for url in links:
+    throttle = _ThreadThrottle(sleep_sec / ARTICLE_PER_HOST)
+
+    def _safe_parse(url):
         try:
-            art = parse_article(url)
-            if art["published_kst"] and is_today_kst(datetime.fromisoformat(art["published_kst"]), today_kst):
-                results.append(art)
+            return parse_article(url, today_date, throttle)  # 요청마다 throttle 대기(비동기 버전과 동일)
         except Exception:
-            pass
-        time.sleep(sleep_sec)  # 예의상 천천히
-    return results
+            return None  # 개별 기사 실패는 무시
 
-# --- 로컬 실행용 진입점(유지) ---
-if __name__ == "__main__":
+    with ThreadPoolExecutor(max_workers=ARTICLE_CONCURRENCY) as ex:
+        arts = list(ex.map(_safe_parse, links))
+    return [art for art in arts if _is_today_article(art, today_date)]
+
+# -----------------------------
+# 2-1) 비동기 크롤링 (aiohttp)
+# -----------------------------
+class _RequestThrottle:
+    """
+    요청 시작 간격을 min_interval 초 이상으로 유지하는 작은 비동기 스로틀.
+    """
+
+    def __init__(self, min_interval: float):
+        self.min_interval = min_interval
+        self._lock = asyncio.Lock()
+        self._last = 0.0
+
+    async def wait(self):
+        if self.min_interval <= 0:
+            return
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            delay = self._last + self.min_interval - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._last = loop.time()
+
+# 크롤링마다 CA 번들을 다시 읽지 않도록 SSL 컨텍스트를 모듈 단위로 재사용.
+# aiohttp 는 HTTP/1.1 만 지원하므로 ALPN 도 http/1.1 만 광고
+_SSL_CTX = ssl.create_default_context()
+_SSL_CTX.set_alpn_protocols(["http/1.1"])
+
+_PARSE_POOL = None
+_PARSE_POOL_LOCK = threading.Lock()  # 동시 인보케이션(각자 asyncio.run)이 풀을 두 번 만들지 않게
+
+def _pool_mp_context():
+    """
+    워커 프로세스 시작 방식. 이미 스레드가 도는 프로세스(Azure 워커, aiohttp 리졸버 등)에서
+    fork 하면 잠긴 락을 물려받아 교착될 수 있으므로 forkserver(없으면 spawn)를 사용.
+    """
+    method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    return multiprocessing.get_context(method)
+
+def _get_parse_pool():
+    """
+    파싱용 프로세스 풀(첫 사용 시 생성, 웜 인보케이션 간 재사용).
+    코어가 하나뿐이거나 풀을 만들 수 없는 환경이면 None(기본 스레드 executor).
+    """
+    global _PARSE_POOL
+    if PARSE_WORKERS <= 1:
+        return None
+    with _PARSE_POOL_LOCK:
+        if _PARSE_POOL is None:
+            try:
+                _PARSE_POOL = ProcessPoolExecutor(max_workers=PARSE_WORKERS, mp_context=_pool_mp_context())
+            except Exception:
+                return None
+        return _PARSE_POOL
+
+def _discard_parse_pool(pool):
+    """깨진 풀을 정리. 다른 인보케이션이 이미 새 풀로 바꿨으면 그 풀은 건드리지 않음."""
+    global _PARSE_POOL
+    with _PARSE_POOL_LOCK:
+        if _PARSE_POOL is pool:
+            _PARSE_POOL = None
+    pool.shutdown(wait=False)
+
+async def _run_parse(func, *args):
+    """CPU 바운드 파싱을 프로세스 풀에서 실행. 풀이 깨지면 정리하고 스레드로 재시도."""
+    loop = asyncio.get_running_loop()
+    pool = _get_parse_pool()
     try:
-        items = crawl_today(today_kst=datetime.now(KST), limit=50, sleep_sec=0.7)
-        print(json.dumps({
-            "date_kst": datetime.now(KST).strftime("%Y-%m-%d"),
-            "count": len(items),
-            "items": items
-        }, ensure_ascii=False, indent=2))
-    except Exception as e:
-        print("LOCAL ERROR:", e)
+        return await loop.run_in_executor(pool, func, *args)
+    except BrokenProcessPool:
+        _discard_parse_pool(pool)
+        return await loop.run_in_executor(None, func, *args)
+
+async def fetch_async(session, url, headers=None):
+    """fetch 의 비동기 버전: (status, headers, text), 304 면 text 는 None, 본문 상한 동일."""
+    async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=20)) as r:
+        r.raise_for_status()
+        if r.status == 304:
+            return r.status, r.headers, None
+        buf = bytearray()
+        async for chunk in r.content.iter_chunked(65536):
+            _append_capped(buf, chunk, url)
+        return r.status, r.headers, _decode_body(buf, r.charset or "utf-8")
+
+async def fetch_head_async(session, url):
+    """fetch_head 의 비동기 버전: </head> 까지만 읽고 연결을 놓음."""
+    buf = bytearray()
+    async with session.get(url, timeout=aiohttp.ClientTimeout(total=20)) as r:
+        r.raise_for_status()
+        async for chunk in r.content.iter_chunked(4096):
+            if _read_until_head_end(buf, chunk):
+                break
+    return buf.decode("utf-8", errors="replace")
+
+async def parse_article_async(session, url, sem, throttle=None, today_date=None):
+    """
+    세마포어로 동시 요청 수를 제한해 기사를 받고, 파싱은 프로세스 풀에서 수행(이벤트 루프 비차단).
+    today_date 가 주어지면 그 날짜 기사가 아닐 때 None(처음 보는 기사는 <head> 로 먼저 판정).
+    캐시 디스크 읽기/쓰기(open/mkstemp/os.replace)는 기본 스레드 풀에서 수행해 이벤트 루프를 막지 않음.
+    """
+    loop = asyncio.get_running_loop()
+    entry = _ARTICLE_CACHE.get(url)  # 메모리 적중이면 스레드 전환 없이
+    if entry is None:
+        entry = await loop.run_in_executor(None, _cache_get, url)
+    if entry and _cache_is_fresh(entry):
+        return _cache_reuse(url, entry)
+    if today_date is not None and entry is None:
+        async with sem:
+            if throttle is not None:
+                await throttle.wait()
+            head_html = await fetch_head_async(session, url)
+        if _is_other_day(_head_published_dt(head_html), today_date):
+            return None
+
+    async with sem:
+        if throttle is not None:
+            await throttle.wait()
+        status, headers, html = await fetch_async(session, url, headers=_cache_validators(entry))
+    if status == 304 and entry:
+        return await loop.run_in_executor(None, _cache_reuse, url, entry, True)
+    art = await _run_parse(_parse_html_sync, html, url, today_date)
+    if art:
+        await loop.run_in_executor(None, _cache_store, url, headers, art)
+    return art
+
+async def crawl_today_async(category_url=CATEGORY_URL, today_kst=None, limit=40, sleep_sec=1.0):
+    """
+    sleep_sec 는 커넥션 하나당 요청 간격으로 해석: 전체 요청 시작 간격은 sleep_sec / ARTICLE_PER_HOST.
+    """
+    _require_deps()
+    if today_kst is None:
+        today_kst = datetime.now(KST)
+    today_date = today_kst.astimezone(KST).date()  # 기사마다 다시 계산하지 않도록 한 번만
+    loop = asyncio.get_running_loop()
+    connector = aiohttp.TCPConnector(
+        limit=20,
+        limit_per_host=ARTICLE_PER_HOST,
+        keepalive_timeout=30,
+        ttl_dns_cache=DNS_CACHE_TTL,
+        ssl=_SSL_CTX,
+    )
+    async with aiohttp.ClientSession(connector=connector, headers=HEADERS) as session:
+        _, _, html = await fetch_async(session, category_url)
+        links = await loop.run_in_executor(None, _extract_article_links, html, limit)
+        sem = asyncio.BoundedSemaphore(ARTICLE_CONCURRENCY)
+        throttle = _RequestThrottle(sleep_sec / ARTICLE_PER_HOST)
+        tasks = [parse_article_async(session, url, sem, throttle, today_date) for url in links]
+        arts = await asyncio.gather(*tasks, return_exceptions=True)
+
+    results = []
+    for art in arts:
+        if isinstance(art, BaseException):
+            continue  # 개별 기사 실패는 무시 (스레드 버전과 동일)
+        if _is_today_article(art, today_date):
+            results.append(art)
+    return results
 
 # -----------------------------
 # 3) Azure Functions 엔드포인트
 # -----------------------------
-try:
-    import azure.functions as func
+if AZURE_OK:
+    # 앱/라우트는 모듈 로드 시 한 번만 등록
     app = func.FunctionApp()
 
     # 라우팅/도메인만 빠르게 확인하는 핑
@@ -260,11 +960,16 @@ try:
     def ping(req: func.HttpRequest) -> func.HttpResponse:
         status = {
             "requests": REQUESTS_OK,
+            "aiohttp": AIOHTTP_OK,
             "beautifulsoup4": BS4_OK,
+            "lxml": LXML_OK,
+            "selectolax": SELECTOLAX_OK,
+            "orjson": ORJSON_OK,
+            "brotli": BROTLI_OK,
             "zoneinfo": ZONEINFO_OK,
             "import_errors": IMPORT_ERRORS,
         }
-        return func.HttpResponse(json.dumps(status), status_code=200, mimetype="application/json")
+        return func.HttpResponse(_json_bytes(status), status_code=200, mimetype="application/json")
 
     # 메인 크롤링 엔드포인트
     @app.route(route="aitoday", methods=["GET", "POST"], auth_level=func.AuthLevel.ANONYMOUS)
@@ -281,7 +986,7 @@ try:
 
             if req.method == "POST":
                 try:
-                    body = req.get_json()
+                    body = _json_loads(req.get_body())
                 except ValueError:
                     body = {}
                 date_str = body.get("date", date_str)
@@ -299,7 +1004,7 @@ try:
                     today_kst = datetime(yyyy, mm, dd, tzinfo=KST)
                 except Exception:
                     return func.HttpResponse(
-                        json.dumps({"error": "invalid date format, use YYYY-MM-DD"}),
+                        _json_bytes({"error": "invalid date format, use YYYY-MM-DD"}),
                         status_code=400,
                         mimetype="application/json",
                     )
@@ -335,7 +1040,7 @@ try:
                 "count": len(items),
                 "items": items,
             }
-            return func.HttpResponse(json.dumps(out, ensure_ascii=False), status_code=200, mimetype="application/json")
+            return func.HttpResponse(_json_bytes(out), status_code=200, mimetype="application/json")
 
         except Exception as e:
             # 의존성/네트워크 등 모든 실패를 JSON으로 리턴
@@ -348,8 +1053,16 @@ try:
                     "beautifulsoup4": BS4_OK,
                     "import_errors": IMPORT_ERRORS
                 }
-            return func.HttpResponse(json.dumps(payload, ensure_ascii=False), status_code=500, mimetype="application/json")
+            return func.HttpResponse(_json_bytes(payload), status_code=500, mimetype="application/json")
 
-except ImportError:
-    # 로컬에서 azure.functions 미설치 시에도 __main__ 동작하도록 무시
-    pass
+# --- 로컬 실행용 진입점(유지) ---
+if __name__ == "__main__":
+    try:
+        items = crawl_today(today_kst=datetime.now(KST), limit=50, sleep_sec=0.7)
+        print(_json_dumps({
+            "date_kst": datetime.now(KST).strftime("%Y-%m-%d"),
+            "count": len(items),
+            "items": items
+        }, indent=True))
+    except Exception as e:
+        print("LOCAL ERROR:", e)